@@ -4,7 +4,14 @@ import argparse
 import json
 from scripts.extract_text import extract_text_from_folder
 from scripts.synthesize_content import generate_job_ad_content, save_generated_content
+from scripts.export_visual import export_visual, load_variants
 from scripts.generate_visual import create_job_ad_visual
+from scripts.render_poster import (
+    DEFAULT_LOGO_PATH,
+    TEMPLATES,
+    load_brand_colors,
+    save_job_ad_poster,
+)
 
 
 def main():
@@ -26,8 +33,79 @@ def main():
         required=True,
         help="Path to the output image file (e.g., data/output/job_ad_visual.png).",
     )
+    parser.add_argument(
+        "--renderer",
+        choices=["falai", "local"],
+        default="falai",
+        help="Generate the visual with Fal.ai recraft-v3 (falai) or compose a poster locally with Pillow (local).",
+    )
+    parser.add_argument(
+        "--template",
+        choices=sorted(TEMPLATES),
+        default=None,
+        help="Poster template used by the local renderer (default: classic).",
+    )
+    parser.add_argument(
+        "--ai_background",
+        action="store_true",
+        help="With the local renderer, use a Fal.ai generated image as the poster background.",
+    )
+    parser.add_argument(
+        "--brand_colors",
+        default=None,
+        help="Brand colors for the local renderer, as a JSON file or inline JSON object "
+        "(keys: background, panel, accent, title, text).",
+    )
+    parser.add_argument(
+        "--logo",
+        default=None,
+        help=f"Logo image for the local renderer (default: {DEFAULT_LOGO_PATH}).",
+    )
+    parser.add_argument(
+        "--font",
+        default=None,
+        help="Optional TrueType font file for the local renderer.",
+    )
+    parser.add_argument(
+        "--export_dir",
+        default=None,
+        help="Optional folder to export LinkedIn, Indeed and thumbnail variants of the final visual, with a manifest.",
+    )
+    parser.add_argument(
+        "--export_variants",
+        default=None,
+        help="Export variants as a JSON file or inline JSON list of objects "
+        "(name, width, height, format, quality); defaults to the built-in set.",
+    )
     args = parser.parse_args()
 
+    # Validate renderer options up front, before any slow or paid API call.
+    local_options = {
+        "--template": args.template,
+        "--ai_background": args.ai_background,
+        "--brand_colors": args.brand_colors,
+        "--logo": args.logo,
+        "--font": args.font,
+    }
+    if args.renderer != "local":
+        used = [name for name, value in local_options.items() if value]
+        if used:
+            parser.error(f"{', '.join(used)} can only be used with --renderer local")
+    brand_colors = None
+    if args.brand_colors:
+        try:
+            brand_colors = load_brand_colors(args.brand_colors)
+        except ValueError as e:
+            parser.error(f"invalid --brand_colors: {e}")
+    if args.export_variants and not args.export_dir:
+        parser.error("--export_variants requires --export_dir")
+    export_variants = None
+    if args.export_variants:
+        try:
+            export_variants = load_variants(args.export_variants)
+        except ValueError as e:
+            parser.error(f"invalid --export_variants: {e}")
+
     # Step 1: Extract text from all supported documents in the folder.
     extracted_docs = extract_text_from_folder(args.folder)
     print(f"Extracted text from {len(extracted_docs)} file(s).")
@@ -49,8 +127,28 @@ def main():
     # Use the job title and summary as basis for the image prompt.
     title = content.get("job_title", "Job Ad")
     summary = content.get("summary", "")
-    # Create the visual; this function returns the path where the image was saved.
-    generated_image_path = create_job_ad_visual(title, summary)
+    if args.renderer == "local":
+        # Compose the poster locally; the AI image is only an optional background layer.
+        background_path = (
+            create_job_ad_visual(title, summary) if args.ai_background else None
+        )
+        try:
+            generated_image_path = save_job_ad_poster(
+                content,
+                args.output_image,
+                template=args.template or "classic",
+                logo_path=args.logo or DEFAULT_LOGO_PATH,
+                background_path=background_path,
+                brand_colors=brand_colors,
+                font_path=args.font,
+            )
+        finally:
+            # The AI image was only an intermediate layer; don't leave it behind.
+            if background_path and os.path.exists(background_path):
+                os.remove(background_path)
+    else:
+        # Create the visual; this function returns the path where the image was saved.
+        generated_image_path = create_job_ad_visual(title, summary)
 
     # Ensure the final image is at the specified output path.
     if os.path.abspath(generated_image_path) != os.path.abspath(args.output_image):
@@ -62,6 +160,18 @@ def main():
 
     print(f"Generated visual saved at {final_image_path}")
 
+    # Step 4: Optionally export the visual to multiple publishing sizes and formats.
+    if args.export_dir:
+        manifest = export_visual(
+            final_image_path, output_dir=args.export_dir, variants=export_variants
+        )
+        for variant in manifest["variants"]:
+            print(
+                f"Exported {variant['name']} ({variant['width']}x{variant['height']} {variant['format']}) "
+                f"(resize {variant['resize_ms']} ms, encode {variant['encode_ms']} ms) to {variant['path']}"
+            )
+        print(f"Export manifest saved at {manifest['manifest_path']}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,218 @@
+# scripts/export_visual.py
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps, features
+
+# Default publishing variants. Each is resized to cover width x height and cropped.
+DEFAULT_VARIANTS = [
+    {"name": "linkedin", "width": 1200, "height": 627, "format": "jpeg", "quality": 90},
+    {"name": "indeed", "width": 1080, "height": 1080, "format": "png"},
+    {"name": "square", "width": 1024, "height": 1024, "format": "webp", "quality": 90},
+    {"name": "thumbnail", "width": 256, "height": 256, "format": "webp", "quality": 80},
+]
+
+FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "png": ("PNG", "png"),
+    "jpeg": ("JPEG", "jpg"),
+    "avif": ("AVIF", "avif"),
+}
+
+
+def _check_variant(variant: dict):
+    """Validate a variant spec up front rather than failing inside a worker thread."""
+    if not isinstance(variant, dict):
+        raise ValueError(f"Export variant must be an object, got: {variant!r}")
+    missing = [
+        key for key in ("name", "width", "height", "format") if key not in variant
+    ]
+    if missing:
+        raise ValueError(f"Export variant {variant!r} is missing: {', '.join(missing)}")
+    for key in ("width", "height"):
+        value = variant[key]
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            raise ValueError(
+                f"Export variant {variant['name']!r} needs a positive integer {key}."
+            )
+    fmt = variant["format"]
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "avif" and not features.check("avif"):
+        raise ValueError("AVIF export requires a Pillow build with AVIF support.")
+
+
+def load_variants(value: str) -> list:
+    """Load export variants from a JSON file path or an inline JSON list string."""
+    if os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as f:
+            variants = json.load(f)
+    else:
+        variants = json.loads(value)
+    if not isinstance(variants, list):
+        raise ValueError("Export variants must be a JSON list of objects.")
+    for variant in variants:
+        _check_variant(variant)
+    return variants
+
+
+def _normalize_mode(image: Image.Image) -> Image.Image:
+    """Convert any input mode (P, CMYK, LA...) to RGBA if it has transparency, else RGB."""
+    mode = "RGBA" if image.has_transparency_data else "RGB"
+    return image if image.mode == mode else image.convert(mode)
+
+
+def _encode_variant(
+    source: Image.Image, variant: dict, output_dir: str, stem: str
+) -> dict:
+    """Resize the shared decoded image for one variant, encode it and write it to disk."""
+    start = time.perf_counter()
+    pil_format, extension = FORMATS[variant["format"]]
+    size = (variant["width"], variant["height"])
+
+    # Image.save stores encoder options on the image object, so each worker must
+    # only ever save an image it created itself, never the shared source.
+    if source.size == size:
+        image = source.copy()
+    else:
+        image = ImageOps.fit(source, size, Image.LANCZOS)
+    if pil_format == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+    resize_ms = (time.perf_counter() - start) * 1000
+
+    options = {}
+    if "quality" in variant:
+        options["quality"] = variant["quality"]
+    if pil_format == "PNG":
+        options["optimize"] = variant.get("optimize", False)
+
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    image.save(buffer, format=pil_format, **options)
+    data = buffer.getvalue()
+    encode_ms = (time.perf_counter() - start) * 1000
+
+    path = os.path.join(output_dir, f"{stem}_{variant['name']}.{extension}")
+    with open(path, "wb") as f:
+        f.write(data)
+
+    return {
+        "name": variant["name"],
+        "path": path,
+        "format": variant["format"],
+        "width": image.width,
+        "height": image.height,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "resize_ms": round(resize_ms, 2),
+        "encode_ms": round(encode_ms, 2),
+    }
+
+
+def export_visual(
+    image,
+    output_dir: str = "data/output",
+    variants: list = None,
+    max_workers: int = None,
+    manifest_path: str = None,
+) -> dict:
+    """
+    Export a generated visual to several sizes and formats in one pass.
+    The image (a path or an already decoded PIL image) is decoded once and the
+    variants are resized and encoded from that shared buffer in a thread pool.
+    Writes a JSON manifest with dimensions, byte sizes, hashes and per-variant
+    resize and encode timings.
+    """
+    if variants is None:
+        variants = DEFAULT_VARIANTS
+    for variant in variants:
+        _check_variant(variant)
+    names = [variant["name"] for variant in variants]
+    if len(set(names)) != len(names):
+        raise ValueError("Export variant names must be unique.")
+
+    start = time.perf_counter()
+    if isinstance(image, Image.Image):
+        source = _normalize_mode(image)
+        source_path = None
+        stem = "job_ad_visual"
+    else:
+        source_path = image
+        stem = os.path.splitext(os.path.basename(image))[0]
+        with Image.open(image) as opened:
+            source = _normalize_mode(opened)
+            if source is opened:
+                # Keep the pixels usable after the file is closed.
+                source = opened.copy()
+    # Force decoding up front so worker threads only ever read the pixel buffer.
+    source.load()
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    os.makedirs(output_dir, exist_ok=True)
+    # Pillow releases the GIL while resizing and encoding, so threads can share
+    # the decoded image without pickling it into separate processes.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda variant: _encode_variant(source, variant, output_dir, stem),
+                variants,
+            )
+        )
+
+    manifest = {
+        "source": source_path,
+        "source_width": source.width,
+        "source_height": source.height,
+        "decode_ms": round(decode_ms, 2),
+        "total_ms": round((time.perf_counter() - start) * 1000, 2),
+        "variants": results,
+    }
+
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, f"{stem}_manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    manifest["manifest_path"] = manifest_path
+
+    return manifest
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export a generated visual to multiple sizes and formats"
+    )
+    parser.add_argument("--image", required=True, help="Path to the generated visual")
+    parser.add_argument(
+        "--output_dir", default="data/output", help="Folder for exported variants"
+    )
+    parser.add_argument(
+        "--variants",
+        default=None,
+        help="Optional JSON file or inline JSON list of variants (name, width, height, format, quality).",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker threads"
+    )
+    args = parser.parse_args()
+
+    variants = load_variants(args.variants) if args.variants else None
+
+    manifest = export_visual(
+        args.image,
+        output_dir=args.output_dir,
+        variants=variants,
+        max_workers=args.workers,
+    )
+    for variant in manifest["variants"]:
+        print(
+            f"{variant['name']}: {variant['width']}x{variant['height']} {variant['format']} "
+            f"{variant['bytes']} bytes, resize {variant['resize_ms']} ms, "
+            f"encode {variant['encode_ms']} ms -> {variant['path']}"
+        )
+    print(f"Manifest saved at {manifest['manifest_path']}")
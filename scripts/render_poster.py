@@ -0,0 +1,390 @@
+# scripts/render_poster.py
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+DEFAULT_LOGO_PATH = "data/images/1.Acme_Logo.jpg"
+
+# Defaults follow the Acme brand guidelines: primary #FF5733, secondary #C70039.
+DEFAULT_BRAND_COLORS = {
+    "background": "#FFFFFF",
+    "panel": "#FFFFFF",
+    "accent": "#FF5733",
+    "title": "#C70039",
+    "text": "#333333",
+}
+
+# Layout templates. Sizes and offsets are in pixels for the given canvas size.
+TEMPLATES = {
+    "classic": {
+        "size": (1024, 1024),
+        "margin": 64,
+        "logo_size": 140,
+        "logo_position": "top_right",
+        "title_size": 64,
+        "heading_size": 30,
+        "body_size": 24,
+        "sections": ["summary", "responsibilities", "requirements"],
+        "max_body_lines": 4,
+    },
+    "banner": {
+        "size": (1200, 627),
+        "margin": 48,
+        "logo_size": 110,
+        "logo_position": "top_left",
+        "title_size": 56,
+        "heading_size": 26,
+        "body_size": 22,
+        "sections": ["summary", "requirements"],
+        "max_body_lines": 3,
+    },
+}
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int, font_path: str = None) -> ImageFont.FreeTypeFont:
+    """
+    Load a font once per (size, path) and keep the decoded face in memory.
+    Falls back to Pillow's bundled font when no path is given.
+    """
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=8192)
+def _text_length(text: str, size: int, font_path: str = None) -> float:
+    """Cached advance width of a piece of text, so repeated words are measured once."""
+    return load_font(size, font_path).getlength(text)
+
+
+@lru_cache(maxsize=32)
+def load_image_asset(path: str, size: int = None) -> Image.Image:
+    """
+    Decode an image asset from disk once and keep it in memory as RGBA.
+    When size is given, the asset is scaled to fit a size x size box.
+    """
+    with Image.open(path) as image:
+        if size:
+            # Let the JPEG decoder downscale while decoding large logos.
+            image.draft("RGB", (size, size))
+            image = image.convert("RGBA")
+            image.thumbnail((size, size), Image.LANCZOS)
+        else:
+            image = image.convert("RGBA")
+    return image
+
+
+# Fast encoder settings per output extension; PNG's default zlib level alone
+# takes several times longer than rendering the poster.
+SAVE_OPTIONS = {
+    "jpg": {"quality": 90},
+    "jpeg": {"quality": 90},
+    "png": {"compress_level": 1},
+    "webp": {"quality": 85, "method": 0},
+}
+
+
+def load_background(
+    path: str, width: int, height: int, panel_color: str = None
+) -> Image.Image:
+    """
+    Decode a background image, cropped and scaled to cover a width x height canvas
+    and optionally washed with a translucent panel color.
+    The file's modification time is part of the cache key, so an image rewritten
+    at the same path is decoded again instead of served stale from the cache.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    return _load_background(path, mtime_ns, width, height, panel_color)
+
+
+@lru_cache(maxsize=8)
+def _load_background(
+    path: str, mtime_ns: int, width: int, height: int, panel_color: str
+) -> Image.Image:
+    with Image.open(path) as image:
+        image.draft("RGB", (width, height))
+        background = ImageOps.fit(image.convert("RGBA"), (width, height), Image.LANCZOS)
+    if panel_color:
+        panel = Image.new("RGBA", (width, height), panel_color)
+        panel.putalpha(200)
+        background.alpha_composite(panel)
+    return background
+
+
+def load_brand_colors(value: str) -> dict:
+    """Load brand colors from a JSON file path or an inline JSON object string."""
+    if os.path.isfile(value):
+        with open(value, "r", encoding="utf-8") as f:
+            colors = json.load(f)
+    else:
+        colors = json.loads(value)
+    if not isinstance(colors, dict):
+        raise ValueError("Brand colors must be a JSON object mapping names to colors.")
+    unknown = set(colors) - set(DEFAULT_BRAND_COLORS)
+    if unknown:
+        raise ValueError(f"Unknown brand color keys: {', '.join(sorted(unknown))}")
+    return colors
+
+
+def _as_text(value) -> str:
+    """Normalize an LLM-provided field (string, list of bullets, number...) to text."""
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_as_text(item) for item in value)
+    return str(value)
+
+
+def _break_word(word: str, size: int, max_width: int, font_path: str = None) -> list:
+    """Hard-break a word wider than max_width (e.g. a URL) into pieces that fit."""
+    pieces, piece = [], ""
+    for char in word:
+        if piece and _text_length(piece + char, size, font_path) > max_width:
+            pieces.append(piece)
+            piece = char
+        else:
+            piece += char
+    pieces.append(piece)
+    return pieces
+
+
+def wrap_text(text: str, size: int, max_width: int, font_path: str = None) -> list:
+    """Greedily wrap text into lines that fit within max_width pixels."""
+    space_width = _text_length(" ", size, font_path)
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        line, line_width = [], 0.0
+        for word in paragraph.split():
+            word_width = _text_length(word, size, font_path)
+            if word_width > max_width:
+                if line:
+                    lines.append(" ".join(line))
+                *full_pieces, word = _break_word(word, size, max_width, font_path)
+                lines.extend(full_pieces)
+                line, line_width = [word], _text_length(word, size, font_path)
+                continue
+            extra = word_width + (space_width if line else 0)
+            if line and line_width + extra > max_width:
+                lines.append(" ".join(line))
+                line, line_width = [word], word_width
+            else:
+                line.append(word)
+                line_width += extra
+        if line:
+            lines.append(" ".join(line))
+    return lines
+
+
+def _fit_lines(
+    lines: list, max_lines: int, size: int, max_width: int, font_path: str = None
+) -> list:
+    """Truncate wrapped lines to max_lines, marking the cut with an ellipsis that still fits."""
+    if len(lines) <= max_lines:
+        return lines
+    last = lines[max_lines - 1].rstrip(" .,;")
+    while last and _text_length(last + "...", size, font_path) > max_width:
+        last = last[:-1].rstrip(" .,;")
+    return lines[: max_lines - 1] + [last + "..."]
+
+
+def render_job_ad_poster(
+    content: dict,
+    template: str = "classic",
+    logo_path: str = DEFAULT_LOGO_PATH,
+    background_path: str = None,
+    brand_colors: dict = None,
+    font_path: str = None,
+) -> Image.Image:
+    """
+    Compose a job ad poster locally from the synthesized JSON content.
+    Uses the given template layout, brand colors and logo; an optional
+    background image (e.g. a recraft-v3 visual) is drawn beneath a panel.
+    """
+    if template not in TEMPLATES:
+        raise ValueError(f"Unknown poster template: {template}")
+    layout = TEMPLATES[template]
+    colors = {**DEFAULT_BRAND_COLORS, **(brand_colors or {})}
+    width, height = layout["size"]
+    margin = layout["margin"]
+
+    if background_path:
+        background = load_background(background_path, width, height, colors["panel"])
+        poster = background.copy()
+    else:
+        poster = Image.new("RGBA", (width, height), colors["background"])
+
+    draw = ImageDraw.Draw(poster)
+    text_left = margin
+    text_width = width - 2 * margin
+    logo_bottom = 0
+
+    if logo_path:
+        logo_size = layout["logo_size"]
+        logo = load_image_asset(logo_path, logo_size)
+        if layout["logo_position"] == "top_right":
+            poster.paste(logo, (width - margin - logo.width, margin), logo)
+            text_width -= logo.width + margin // 2
+        else:
+            poster.paste(logo, (margin, margin), logo)
+            text_left += logo.width + margin // 2
+            text_width -= logo.width + margin // 2
+        logo_bottom = margin + logo.height
+
+    # Title block
+    y = margin
+    title_size = layout["title_size"]
+    title_font = load_font(title_size, font_path)
+    title = _as_text(content.get("job_title")) or "Job Ad"
+    wrapped_title = wrap_text(title, title_size, text_width, font_path)
+    title_lines = _fit_lines(wrapped_title, 2, title_size, text_width, font_path)
+    for line in title_lines:
+        draw.text((text_left, y), line, font=title_font, fill=colors["title"])
+        y += int(title_size * 1.2)
+    y += margin // 4
+    draw.rectangle((text_left, y, text_left + 120, y + 6), fill=colors["accent"])
+    y = max(y + margin // 2, logo_bottom + margin // 2)
+
+    # Content sections, laid out full width below the title block and logo
+    heading_size = layout["heading_size"]
+    body_size = layout["body_size"]
+    heading_font = load_font(heading_size, font_path)
+    body_font = load_font(body_size, font_path)
+    body_width = width - 2 * margin
+    for section in layout["sections"]:
+        text = _as_text(content.get(section))
+        if not text.strip():
+            continue
+        if y + heading_size + body_size > height - margin:
+            break
+        heading = section.replace("_", " ").title()
+        draw.text((margin, y), heading, font=heading_font, fill=colors["accent"])
+        y += int(heading_size * 1.4)
+        remaining = max(1, (height - margin - y) // int(body_size * 1.35))
+        max_lines = min(layout["max_body_lines"], remaining)
+        wrapped = wrap_text(text, body_size, body_width, font_path)
+        lines = _fit_lines(wrapped, max_lines, body_size, body_width, font_path)
+        for line in lines:
+            draw.text((margin, y), line, font=body_font, fill=colors["text"])
+            y += int(body_size * 1.35)
+        y += margin // 2
+
+    return poster.convert("RGB")
+
+
+def save_job_ad_poster(content: dict, output_path: str = None, **render_options) -> str:
+    """Render a poster and save it to output_path (or a timestamped file in data/output)."""
+    if output_path is None:
+        output_path = os.path.join(
+            "data/output",
+            f"job_ad_poster_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jpg",
+        )
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    extension = os.path.splitext(output_path)[1].lstrip(".").lower()
+    poster = render_job_ad_poster(content, **render_options)
+    poster.save(output_path, **SAVE_OPTIONS.get(extension, {}))
+    return output_path
+
+
+def _render_indexed(args) -> str:
+    content, output_path, render_options = args
+    return save_job_ad_poster(content, output_path, **render_options)
+
+
+def render_posters(
+    contents: list,
+    output_dir: str = "data/output",
+    extension: str = "jpg",
+    max_workers: int = None,
+    name_prefix: str = "job_ad_poster",
+    **render_options,
+) -> list:
+    """
+    Render many posters in parallel across CPU cores.
+    Each worker process keeps its own font and asset caches warm across the batch.
+    Files are named <name_prefix>_<timestamp>_<index>; returns the saved paths
+    in the same order as contents.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    jobs = [
+        (
+            content,
+            os.path.join(output_dir, f"{name_prefix}_{stamp}_{i:03d}.{extension}"),
+            render_options,
+        )
+        for i, content in enumerate(contents)
+    ]
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_render_indexed(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Chunking amortizes the pickling overhead and keeps per-worker caches hot.
+        chunksize = max(1, len(jobs) // ((max_workers or os.cpu_count() or 1) * 4))
+        return list(executor.map(_render_indexed, jobs, chunksize=chunksize))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Render job ad posters locally from synthesized JSON content"
+    )
+    parser.add_argument(
+        "--input_json",
+        required=True,
+        help="Path to a JSON file with one job ad object or a list of them.",
+    )
+    parser.add_argument(
+        "--output_dir", default="data/output", help="Folder for rendered posters"
+    )
+    parser.add_argument("--template", default="classic", choices=sorted(TEMPLATES))
+    parser.add_argument(
+        "--logo", default=DEFAULT_LOGO_PATH, help="Path to the logo image"
+    )
+    parser.add_argument(
+        "--background",
+        default=None,
+        help="Optional background image (e.g. an AI visual)",
+    )
+    parser.add_argument(
+        "--brand_colors",
+        default=None,
+        help="Brand colors as a JSON file or inline JSON object (keys: background, panel, accent, title, text).",
+    )
+    parser.add_argument("--font", default=None, help="Optional TrueType font file")
+    parser.add_argument(
+        "--extension",
+        default="jpg",
+        choices=sorted(SAVE_OPTIONS),
+        help="Output image format for the rendered posters.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes"
+    )
+    args = parser.parse_args()
+
+    with open(args.input_json, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    contents = data if isinstance(data, list) else [data]
+
+    paths = render_posters(
+        contents,
+        output_dir=args.output_dir,
+        extension=args.extension,
+        max_workers=args.workers,
+        template=args.template,
+        logo_path=args.logo,
+        background_path=args.background,
+        brand_colors=(
+            load_brand_colors(args.brand_colors) if args.brand_colors else None
+        ),
+        font_path=args.font,
+    )
+    for path in paths:
+        print(f"Rendered poster saved at {path}")
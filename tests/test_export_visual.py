@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from scripts.export_visual import DEFAULT_VARIANTS, export_visual, load_variants
+
+
+class TestExportVisual(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.temp_dir.name, "job_ad_visual.webp")
+        # A gradient rather than a flat color, so encoder quality affects the output bytes.
+        Image.linear_gradient("L").resize((512, 512)).convert("RGB").save(
+            self.image_path
+        )
+        self.output_dir = os.path.join(self.temp_dir.name, "export")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_export_default_variants(self):
+        manifest = export_visual(self.image_path, output_dir=self.output_dir)
+
+        self.assertEqual(len(manifest["variants"]), len(DEFAULT_VARIANTS))
+        for variant, spec in zip(manifest["variants"], DEFAULT_VARIANTS):
+            self.assertEqual(variant["name"], spec["name"])
+            with open(variant["path"], "rb") as f:
+                data = f.read()
+            self.assertEqual(variant["bytes"], len(data))
+            self.assertEqual(variant["sha256"], hashlib.sha256(data).hexdigest())
+            self.assertGreaterEqual(variant["resize_ms"], 0)
+            self.assertGreaterEqual(variant["encode_ms"], 0)
+            with Image.open(variant["path"]) as image:
+                self.assertEqual(image.size, (spec["width"], spec["height"]))
+
+        # The manifest written to disk matches what was returned.
+        with open(manifest["manifest_path"], "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertEqual(saved["variants"], manifest["variants"])
+
+    def test_source_is_decoded_once(self):
+        with patch("scripts.export_visual.Image.open", wraps=Image.open) as mock_open:
+            export_visual(self.image_path, output_dir=self.output_dir)
+        mock_open.assert_called_once_with(self.image_path)
+
+    def test_export_in_memory_image(self):
+        image = Image.new("RGBA", (300, 200), (255, 0, 0, 128))
+        variants = [{"name": "banner", "width": 150, "height": 100, "format": "jpeg"}]
+        manifest = export_visual(image, output_dir=self.output_dir, variants=variants)
+
+        self.assertIsNone(manifest["source"])
+        self.assertEqual(manifest["variants"][0]["width"], 150)
+        self.assertTrue(manifest["variants"][0]["path"].endswith(".jpg"))
+
+    def test_parallel_same_size_variants_match_serial(self):
+        # Several variants keep the source size, so workers must not share encoder state.
+        variants = [
+            {
+                "name": f"{fmt}_{quality}",
+                "width": 512,
+                "height": 512,
+                "format": fmt,
+                "quality": quality,
+            }
+            for fmt in ("jpeg", "webp")
+            for quality in (30, 50, 70, 90)
+        ]
+        serial = export_visual(
+            self.image_path,
+            output_dir=os.path.join(self.temp_dir.name, "serial"),
+            variants=variants,
+            max_workers=1,
+        )
+        parallel = export_visual(
+            self.image_path,
+            output_dir=os.path.join(self.temp_dir.name, "parallel"),
+            variants=variants,
+            max_workers=8,
+        )
+        self.assertEqual(
+            [variant["sha256"] for variant in parallel["variants"]],
+            [variant["sha256"] for variant in serial["variants"]],
+        )
+
+    def test_empty_variants_exports_nothing(self):
+        manifest = export_visual(
+            self.image_path, output_dir=self.output_dir, variants=[]
+        )
+        self.assertEqual(manifest["variants"], [])
+
+    def test_variant_missing_size(self):
+        variants = [{"name": "thumb", "height": 10, "format": "png"}]
+        with self.assertRaises(ValueError):
+            export_visual(
+                self.image_path, output_dir=self.output_dir, variants=variants
+            )
+
+    def test_load_variants(self):
+        variants = load_variants(
+            '[{"name": "thumb", "width": 64, "height": 64, "format": "webp"}]'
+        )
+        self.assertEqual(variants[0]["name"], "thumb")
+        with self.assertRaises(ValueError):
+            load_variants('{"name": "thumb"}')
+
+    def test_palette_transparency_is_kept(self):
+        palette_path = os.path.join(self.temp_dir.name, "palette.png")
+        Image.new("P", (64, 64), 0).save(palette_path, transparency=0)
+        variants = [{"name": "thumb", "width": 32, "height": 32, "format": "png"}]
+        manifest = export_visual(
+            palette_path, output_dir=self.output_dir, variants=variants
+        )
+        with Image.open(manifest["variants"][0]["path"]) as image:
+            self.assertEqual(image.mode, "RGBA")
+
+    def test_in_memory_cmyk_image(self):
+        image = Image.new("CMYK", (64, 64), (0, 255, 255, 0))
+        variants = [{"name": "thumb", "width": 32, "height": 32, "format": "png"}]
+        manifest = export_visual(image, output_dir=self.output_dir, variants=variants)
+        with Image.open(manifest["variants"][0]["path"]) as exported:
+            self.assertEqual(exported.mode, "RGB")
+
+    def test_unsupported_format(self):
+        variants = [{"name": "bad", "width": 10, "height": 10, "format": "bmp"}]
+        with self.assertRaises(ValueError):
+            export_visual(
+                self.image_path, output_dir=self.output_dir, variants=variants
+            )
+
+    def test_duplicate_variant_names(self):
+        variants = [
+            {"name": "thumb", "width": 10, "height": 10, "format": "png"},
+            {"name": "thumb", "width": 20, "height": 20, "format": "png"},
+        ]
+        with self.assertRaises(ValueError):
+            export_visual(
+                self.image_path, output_dir=self.output_dir, variants=variants
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import os
+import statistics
+import tempfile
+import time
+import unittest
+
+from PIL import Image
+
+from scripts.render_poster import (
+    TEMPLATES,
+    _fit_lines,
+    _text_length,
+    load_background,
+    load_brand_colors,
+    load_image_asset,
+    render_job_ad_poster,
+    render_posters,
+    save_job_ad_poster,
+    wrap_text,
+)
+
+
+class TestRenderPoster(unittest.TestCase):
+    def setUp(self):
+        self.content = {
+            "job_title": "Senior Data Analyst",
+            "summary": "Turn data into decisions for product and business teams.",
+            "responsibilities": "Build dashboards. Define metrics. Partner with engineering.",
+            "requirements": "3+ years of experience with SQL and Python.",
+            "qualifications": "Bachelor's degree in a quantitative field.",
+        }
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # A small logo asset so the tests don't depend on data/images.
+        self.logo_path = os.path.join(self.temp_dir.name, "logo.png")
+        Image.new("RGB", (400, 200), "red").save(self.logo_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_wrap_text_fits_width(self):
+        text = (
+            "Collaborate with cross-functional teams to deliver scalable applications"
+        )
+        lines = wrap_text(text, 24, 300)
+        self.assertGreater(len(lines), 1)
+        self.assertEqual(" ".join(lines), text)
+
+    def test_wrap_text_breaks_oversized_words(self):
+        url = "https://careers.example.com/" + "a" * 80
+        lines = wrap_text(f"Apply at {url} today", 24, 200)
+        for line in lines:
+            self.assertLessEqual(_text_length(line, 24), 200)
+        self.assertEqual("".join(lines).replace(" ", ""), f"Applyat{url}today")
+
+    def test_fit_lines_ellipsis_fits_width(self):
+        lines = wrap_text("word " * 50, 24, 200)
+        fitted = _fit_lines(lines, 2, 24, 200)
+        self.assertEqual(len(fitted), 2)
+        self.assertTrue(fitted[-1].endswith("..."))
+        self.assertLessEqual(_text_length(fitted[-1], 24), 200)
+
+    def test_render_uses_template_size(self):
+        for name, layout in TEMPLATES.items():
+            poster = render_job_ad_poster(
+                self.content, template=name, logo_path=self.logo_path
+            )
+            self.assertEqual(poster.size, layout["size"])
+            self.assertEqual(poster.mode, "RGB")
+
+    def test_render_unknown_template(self):
+        with self.assertRaises(ValueError):
+            render_job_ad_poster(self.content, template="missing")
+
+    def test_render_non_string_sections(self):
+        # LLM output often uses bullet lists or non-string values.
+        content = dict(
+            self.content,
+            job_title=42,
+            responsibilities=["Build dashboards.", "Define metrics."],
+            requirements=None,
+        )
+        poster = render_job_ad_poster(content, logo_path=self.logo_path)
+        self.assertEqual(poster.size, TEMPLATES["classic"]["size"])
+
+    def test_load_brand_colors(self):
+        self.assertEqual(
+            load_brand_colors('{"accent": "#FF5733"}'), {"accent": "#FF5733"}
+        )
+        colors_path = os.path.join(self.temp_dir.name, "colors.json")
+        with open(colors_path, "w", encoding="utf-8") as f:
+            f.write('{"title": "#C70039"}')
+        self.assertEqual(load_brand_colors(colors_path), {"title": "#C70039"})
+        with self.assertRaises(ValueError):
+            load_brand_colors('{"unknown": "#000000"}')
+
+    def test_logo_asset_is_cached_and_scaled(self):
+        first = load_image_asset(self.logo_path, 100)
+        second = load_image_asset(self.logo_path, 100)
+        self.assertIs(first, second)
+        self.assertEqual(first.size, (100, 50))
+
+    def test_background_cache_sees_rewritten_file(self):
+        background_path = os.path.join(self.temp_dir.name, "visual.png")
+        Image.new("RGB", (64, 64), "blue").save(background_path)
+        first = load_background(background_path, 32, 32)
+        Image.new("RGB", (64, 64), "green").save(background_path)
+        # Make sure the rewrite gets a different mtime even on coarse filesystems.
+        stat = os.stat(background_path)
+        os.utime(background_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = load_background(background_path, 32, 32)
+        self.assertEqual(first.getpixel((0, 0))[:3], (0, 0, 255))
+        self.assertEqual(second.getpixel((0, 0))[:3], (0, 128, 0))
+
+    def test_poster_with_background_under_100ms(self):
+        background_path = os.path.join(self.temp_dir.name, "visual.webp")
+        Image.effect_noise((1024, 1024), 64).convert("RGB").save(background_path)
+        options = {"logo_path": self.logo_path, "background_path": background_path}
+        # Warm the font and asset caches, as a batch worker would be.
+        save_job_ad_poster(
+            self.content, os.path.join(self.temp_dir.name, "warm.jpg"), **options
+        )
+
+        timings = []
+        for i in range(10):
+            output_path = os.path.join(self.temp_dir.name, f"poster_{i}.jpg")
+            start = time.perf_counter()
+            save_job_ad_poster(self.content, output_path, **options)
+            timings.append(time.perf_counter() - start)
+        self.assertLess(statistics.median(timings), 0.1)
+
+    def test_save_with_background(self):
+        background_path = os.path.join(self.temp_dir.name, "background.webp")
+        Image.new("RGB", (512, 512), "blue").save(background_path)
+        output_path = os.path.join(self.temp_dir.name, "poster.png")
+
+        path = save_job_ad_poster(
+            self.content,
+            output_path,
+            logo_path=self.logo_path,
+            background_path=background_path,
+            brand_colors={"accent": "#00FF00"},
+        )
+
+        self.assertEqual(path, output_path)
+        with Image.open(path) as image:
+            self.assertEqual(image.size, TEMPLATES["classic"]["size"])
+
+    def test_render_posters_in_parallel(self):
+        contents = [dict(self.content, job_title=f"Role {i}") for i in range(3)]
+        paths = render_posters(
+            contents,
+            output_dir=self.temp_dir.name,
+            max_workers=2,
+            logo_path=self.logo_path,
+        )
+        self.assertEqual(len(paths), 3)
+        self.assertEqual(len(set(paths)), 3)
+        for path in paths:
+            self.assertTrue(os.path.exists(path))
+
+        # A second batch straight after must not overwrite the first one.
+        more_paths = render_posters(
+            contents,
+            output_dir=self.temp_dir.name,
+            max_workers=1,
+            logo_path=self.logo_path,
+        )
+        self.assertFalse(set(paths) & set(more_paths))
+
+
+if __name__ == "__main__":
+    unittest.main()